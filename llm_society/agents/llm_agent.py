@@ -4,6 +4,7 @@ LLM-driven Agent implementation for Society Simulation
 
 import asyncio
 import logging
+import math
 import random
 import uuid
 from dataclasses import asdict, dataclass, field
@@ -70,9 +71,10 @@ class Position:
     
     def distance_to(self, other: "Position") -> float:
         """Calculate Euclidean distance to another position"""
-        return np.sqrt(
-            (self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2
-        )
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
     
     def move_towards(self, target: "Position", speed: float) -> "Position":
         """Move towards target position with given speed"""
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     """Agent memory item"""
 
@@ -27,7 +27,7 @@ class Memory:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Memory":
-        data["tags"] = list(data.get("tags", []))
+        data["tags"] = list(data.get("tags") or [])
         return cls(**data)
 
 
@@ -3,6 +3,7 @@ Spatial Agent Mixin - Movement and positioning capabilities
 """
 
 import logging
+import math
 import random
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     """3D position with utilities"""
 
@@ -25,23 +26,35 @@ class Position:
 
     def distance_to(self, other: "Position") -> float:
         """Calculate Euclidean distance to another position"""
-        return np.sqrt(
-            (self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2
-        )
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     def move_towards(self, target: "Position", speed: float) -> "Position":
         """Move towards target position with given speed"""
-        direction = np.array([target.x - self.x, target.y - self.y, target.z - self.z])
-        distance = np.linalg.norm(direction)
+        dx = target.x - self.x
+        dy = target.y - self.y
+        dz = target.z - self.z
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
 
         if distance <= speed:
             return Position(target.x, target.y, target.z)
 
-        direction = direction / distance * speed
+        factor = speed / distance
         return Position(
-            self.x + direction[0], self.y + direction[1], self.z + direction[2]
+            self.x + dx * factor, self.y + dy * factor, self.z + dz * factor
         )
 
+    def to_array(self) -> np.ndarray:
+        return np.array([self.x, self.y, self.z], dtype=np.float64)
+
+    @staticmethod
+    def batch_distance(xyz_src: np.ndarray, xyz_dst: np.ndarray) -> np.ndarray:
+        """Pairwise distances between (N, 3) and (M, 3) coordinate arrays"""
+        diff = xyz_src[:, None, :] - xyz_dst[None, :, :]
+        return np.sqrt((diff**2).sum(axis=-1))
+
     def to_dict(self) -> dict:
         return {"x": self.x, "y": self.y, "z": self.z}
 
@@ -50,6 +63,26 @@ class Position:
         return cls(x=data.get("x", 0.0), y=data.get("y", 0.0), z=data.get("z", 0.0))
 
 
+def distances_to(src: Position, targets: np.ndarray) -> np.ndarray:
+    """Distances from one position to each row of an (N, 3) coordinate array"""
+    return np.linalg.norm(targets - src.to_array(), axis=1)
+
+
+def move_towards_batch(
+    positions: np.ndarray, targets: np.ndarray, speed: float
+) -> np.ndarray:
+    """Vectorized Position.move_towards over (N, 3) coordinate arrays.
+
+    Rows within ``speed`` of their target snap to it; the rest advance
+    ``speed`` units along the straight line towards it.
+    """
+    delta = targets - positions
+    distance = np.linalg.norm(delta, axis=1)
+    reached = distance <= speed
+    factor = np.divide(speed, distance, out=np.ones_like(distance), where=~reached)
+    return np.where(reached[:, None], targets, positions + delta * factor[:, None])
+
+
 class SpatialMixin:
     """Mixin providing spatial/movement capabilities to agents"""
 
@@ -85,15 +118,13 @@ class SpatialMixin:
 
     def _get_nearby_agents(self):
         """Get agents within social radius"""
-        nearby = []
         social_r = getattr(self.config.agents, "social_radius", 10.0)
-        for agent in self.model.schedule.agents:
-            if (
-                agent.unique_id != self.unique_id
-                and self.position.distance_to(agent.position) <= social_r
-            ):
-                nearby.append(agent)
-        return nearby
+        return [
+            agent
+            for agent in self.model.schedule.agents
+            if agent.unique_id != self.unique_id
+            and self.position.distance_to(agent.position) <= social_r
+        ]
 
     def _get_nearby_objects(self):
         """Get objects within interaction radius"""
@@ -14,6 +14,8 @@ from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from llm_society.utils.enum_utils import enum_from_value
+
 # Assuming DatabaseHandler is importable if type hinting is desired for db_handler
 # from src.database.database_handler import DatabaseHandler
 
@@ -101,7 +103,9 @@ class BankTransaction:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BankTransaction":
-        data["transaction_type"] = TransactionType(data["transaction_type"])
+        data["transaction_type"] = enum_from_value(
+            TransactionType, data["transaction_type"]
+        )
         # Ensure all fields required by __init__ are present or provide defaults
         return cls(**data)
 
@@ -147,7 +151,7 @@ class BankAccount:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BankAccount":
-        data["account_type"] = AccountType(data["account_type"])
+        data["account_type"] = enum_from_value(AccountType, data["account_type"])
         data["transactions"] = [
             BankTransaction.from_dict(txn_data)
             for txn_data in data.get("transactions", [])
@@ -202,8 +206,8 @@ class Loan:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Loan":
-        data["loan_type"] = LoanType(data["loan_type"])
-        data["status"] = LoanStatus(data["status"])
+        data["loan_type"] = enum_from_value(LoanType, data["loan_type"])
+        data["status"] = enum_from_value(LoanStatus, data["status"])
         # payment_history is already a list of dicts
         return cls(**data)
 
@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import numpy as np
 
+from llm_society.utils.enum_utils import enum_from_value
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,7 +48,7 @@ class OrderStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeOrder:
     """Individual trade order in the market"""
 
@@ -68,19 +70,44 @@ class TradeOrder:
     expiry_time: Optional[float] = None
     priority: float = 1.0  # Higher priority = processed first
 
+    # Orders are (de)serialized in bulk when restoring markets, so both
+    # directions spell out the fields instead of reflecting over them.
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["resource_type"] = self.resource_type.value
-        data["order_type"] = self.order_type.value
-        data["status"] = self.status.value
-        return data
+        return {
+            "order_id": self.order_id,
+            "agent_id": self.agent_id,
+            "resource_type": self.resource_type.value,
+            "order_type": self.order_type.value,
+            "quantity": self.quantity,
+            "price_per_unit": self.price_per_unit,
+            "max_price": self.max_price,
+            "min_price": self.min_price,
+            "quantity_filled": self.quantity_filled,
+            "status": self.status.value,
+            "created_time": self.created_time,
+            "expiry_time": self.expiry_time,
+            "priority": self.priority,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TradeOrder":
-        data["resource_type"] = ResourceType(data["resource_type"])
-        data["order_type"] = TradeOrderType(data["order_type"])
-        data["status"] = OrderStatus(data["status"])
-        return cls(**data)
+        return cls(
+            order_id=data["order_id"],
+            agent_id=data["agent_id"],
+            resource_type=enum_from_value(ResourceType, data["resource_type"]),
+            order_type=enum_from_value(TradeOrderType, data["order_type"]),
+            quantity=data["quantity"],
+            price_per_unit=data["price_per_unit"],
+            max_price=data.get("max_price"),
+            min_price=data.get("min_price"),
+            quantity_filled=data.get("quantity_filled", 0.0),
+            status=enum_from_value(OrderStatus, data["status"]),
+            created_time=(
+                data["created_time"] if "created_time" in data else time.time()
+            ),
+            expiry_time=data.get("expiry_time"),
+            priority=data.get("priority", 1.0),
+        )
 
 
 @dataclass
@@ -111,7 +138,7 @@ class Transaction:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Transaction":
-        data["resource_type"] = ResourceType(data["resource_type"])
+        data["resource_type"] = enum_from_value(ResourceType, data["resource_type"])
         return cls(**data)
 
 
@@ -165,7 +192,7 @@ class PriceHistory:
     @classmethod
     def from_dict(cls, data: Dict[str, Any], maxlen: int = 1000) -> "PriceHistory":
         return cls(
-            resource_type=ResourceType(data["resource_type"]),
+            resource_type=enum_from_value(ResourceType, data["resource_type"]),
             prices=deque(data.get("prices", []), maxlen=maxlen),
             volumes=deque(data.get("volumes", []), maxlen=maxlen),
             timestamps=deque(data.get("timestamps", []), maxlen=maxlen),
@@ -421,7 +448,7 @@ class Market:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Market":
-        resource_type = ResourceType(data["resource_type"])
+        resource_type = enum_from_value(ResourceType, data["resource_type"])
         market = cls(resource_type, data.get("base_price", 1.0))
         market.current_price = data.get("current_price", market.base_price)
         market.buy_orders = [
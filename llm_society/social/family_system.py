@@ -15,12 +15,14 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 import networkx as nx
 from networkx.readwrite import json_graph
 
+from llm_society.utils.enum_utils import enum_from_value
+
 # from src.database.database_handler import DatabaseHandler # For type hinting if needed
 
 logger = logging.getLogger(__name__)
 
 
-class FamilyType(Enum):
+class FamilyType(str, Enum):
     """Types of family structures"""
 
     NUCLEAR = "nuclear"  # Parents + children
@@ -33,7 +35,7 @@ class FamilyType(Enum):
         return self.value
 
 
-class RelationshipType(Enum):
+class RelationshipType(str, Enum):
     """Types of family relationships"""
 
     PARENT = "parent"
@@ -72,7 +74,8 @@ class FamilyMember:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FamilyMember":
         relationships = {
-            k: RelationshipType(v) for k, v in data.get("relationships", {}).items()
+            k: enum_from_value(RelationshipType, v)
+            for k, v in data.get("relationships", {}).items()
         }
         return cls(
             agent_id=data["agent_id"],
@@ -140,7 +143,7 @@ class Family:
         )
 
         init_data = data.copy()
-        init_data["family_type"] = FamilyType(data["family_type"])
+        init_data["family_type"] = enum_from_value(FamilyType, data["family_type"])
         init_data["members"] = set(data.get("members", []))
         init_data["family_tree"] = family_tree
 
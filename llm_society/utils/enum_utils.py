@@ -0,0 +1,23 @@
+"""
+Enum helpers shared by the serialization code
+"""
+
+from enum import Enum
+from typing import Any, Type, TypeVar
+
+E = TypeVar("E", bound=Enum)
+
+
+def enum_from_value(enum_cls: Type[E], value: Any) -> E:
+    """
+    Look up the member of enum_cls for value, as enum_cls(value) would.
+
+    Known values are read straight from the enum's value map, skipping
+    EnumMeta.__call__. Anything else (an existing member, an unknown or
+    unhashable value) falls through to enum_cls(value), so the result and
+    the ValueError on bad input match the plain constructor.
+    """
+    try:
+        return enum_cls._value2member_map_[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
@@ -8,11 +8,23 @@ import json
 import math
 import random
 import time
-from collections import defaultdict
-from dataclasses import asdict, dataclass
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
+# Fixed slots in SocietyAgent.resources
+FOOD, CURRENCY, MATERIALS, TOOLS = range(4)
+RESOURCE_NAMES = ("food", "currency", "materials", "tools")
+
+INTERACTION_RADIUS = 15.0
+TRADE_RADIUS = 20.0
+MOVEMENT_SPEED = 2.0
+# Neighbor grid cell size: the largest query radius plus one step of
+# movement, since the grid is bucketed once at the start of each step.
+GRID_CELL_SIZE = TRADE_RADIUS + MOVEMENT_SPEED
+
 
 class AgentType(Enum):
     FARMER = "farmer"
@@ -68,7 +80,7 @@ class Position:
 @dataclass
 class Memory:
     content: str
-    timestamp: float
+    timestamp: int  # world step the memory was formed in
     importance: float = 0.5
 
 
@@ -98,12 +110,12 @@ class SocietyAgent:
         self.social_reputation = 0.5
 
         # Economic
-        self.resources = {
-            "food": random.randint(10, 50),
-            "currency": random.randint(100, 1000),
-            "materials": random.randint(5, 25),
-            "tools": random.randint(1, 5),
-        }
+        self.resources = [
+            random.randint(10, 50),  # FOOD
+            random.randint(100, 1000),  # CURRENCY
+            random.randint(5, 25),  # MATERIALS
+            random.randint(1, 5),  # TOOLS
+        ]
         self.employed = random.choice([True, False])
 
         # Memory and personality
@@ -117,7 +129,7 @@ class SocietyAgent:
 
         # Movement
         self.target_position = None
-        self.movement_speed = 2.0
+        self.movement_speed = MOVEMENT_SPEED
 
     def step(self, world):
         """Main agent step function"""
@@ -132,19 +144,16 @@ class SocietyAgent:
 
     def _make_decision(self, world) -> str:
         """Simplified decision making (would be LLM in full version)"""
-        context = self._gather_context(world)
+        nearby_agents = self._gather_context(world)
 
         # Rule-based decision making based on agent type and context
         if self.energy < 0.3:
             return "rest"
-        elif self.resources["food"] < 5:
+        elif self.resources[FOOD] < 5:
             return "gather_food"
-        elif (
-            len(context["nearby_agents"]) > 0
-            and self.personality_traits["extroversion"] > 0.7
-        ):
+        elif len(nearby_agents) > 0 and self.personality_traits["extroversion"] > 0.7:
             return "socialize"
-        elif self.agent_type == AgentType.TRADER and self.resources["currency"] > 200:
+        elif self.agent_type == AgentType.TRADER and self.resources[CURRENCY] > 200:
             return "trade"
         elif self.agent_type == AgentType.FARMER:
             return "work_farm"
@@ -155,28 +164,19 @@ class SocietyAgent:
         else:
             return "work"
 
-    def _gather_context(self, world) -> Dict[str, Any]:
-        """Gather information about surroundings"""
-        nearby_agents = []
-        for other in world.agents:
-            if other.agent_id != self.agent_id:
-                distance = self.position.distance_to(other.position)
-                if distance < 15.0:  # Interaction radius
-                    nearby_agents.append(
-                        {
-                            "agent": other,
-                            "distance": distance,
-                            "type": other.agent_type.value,
-                            "cultural_group": other.cultural_group.value,
-                        }
-                    )
+    def _gather_context(self, world) -> List[Dict[str, Any]]:
+        """Gather information about nearby agents"""
+        nearby_agents = [
+            {
+                "agent": other,
+                "distance": math.sqrt(dist_sq),
+                "type": other.agent_type.value,
+                "cultural_group": other.cultural_group.value,
+            }
+            for other, dist_sq in world.neighbors_within(self, INTERACTION_RADIUS)
+        ]
 
-        return {
-            "nearby_agents": nearby_agents,
-            "my_resources": self.resources.copy(),
-            "my_energy": self.energy,
-            "my_happiness": self.happiness,
-        }
+        return nearby_agents
 
     def _execute_action(self, action: str, world):
         """Execute the chosen action"""
@@ -214,14 +214,12 @@ class SocietyAgent:
     def _socialize(self, world):
         """Interact with nearby agents"""
         nearby = [
-            agent
-            for agent in world.agents
-            if agent.agent_id != self.agent_id
-            and self.position.distance_to(agent.position) < 15.0
+            agent for agent, _ in world.neighbors_within(self, INTERACTION_RADIUS)
         ]
 
         if nearby:
-            other = random.choice(nearby)
+            # Index with one uniform draw; cheaper than random.choice
+            other = nearby[int(random.random() * len(nearby))]
             self._interact_with(other)
 
         self.state = AgentState.SOCIALIZING
@@ -252,30 +250,30 @@ class SocietyAgent:
         """Try to trade with nearby agents"""
         nearby_traders = [
             agent
-            for agent in world.agents
-            if agent.agent_id != self.agent_id
-            and self.position.distance_to(agent.position) < 20.0
-            and agent.resources["currency"] > 50
+            for agent, _ in world.neighbors_within(self, TRADE_RADIUS)
+            if agent.resources[CURRENCY] > 50
         ]
 
-        if nearby_traders and self.resources["materials"] > 5:
-            other = random.choice(nearby_traders)
+        if nearby_traders and self.resources[MATERIALS] > 5:
+            other = nearby_traders[int(random.random() * len(nearby_traders))]
             # Simple trade: materials for currency
-            trade_amount = min(5, self.resources["materials"])
+            trade_amount = min(5, self.resources[MATERIALS])
             price = trade_amount * 10
 
-            if other.resources["currency"] >= price:
-                self.resources["materials"] -= trade_amount
-                self.resources["currency"] += price
-                other.resources["materials"] += trade_amount
-                other.resources["currency"] -= price
+            if other.resources[CURRENCY] >= price:
+                self.resources[MATERIALS] -= trade_amount
+                self.resources[CURRENCY] += price
+                other.resources[MATERIALS] += trade_amount
+                other.resources[CURRENCY] -= price
 
                 # Record trade memory
                 self._add_memory(
-                    f"Traded {trade_amount} materials for {price} currency with {other.agent_id}"
+                    f"Traded {trade_amount} materials for {price} currency with {other.agent_id}",
+                    world.step_count,
                 )
                 other._add_memory(
-                    f"Bought {trade_amount} materials for {price} currency from {self.agent_id}"
+                    f"Bought {trade_amount} materials for {price} currency from {self.agent_id}",
+                    world.step_count,
                 )
 
         self.state = AgentState.TRADING
@@ -284,16 +282,16 @@ class SocietyAgent:
     def _work(self):
         """Work to produce resources"""
         if self.agent_type == AgentType.FARMER:
-            self.resources["food"] += random.randint(3, 8)
+            self.resources[FOOD] += random.randint(3, 8)
         elif self.agent_type == AgentType.CRAFTSMAN:
-            if self.resources["materials"] > 2:
-                self.resources["materials"] -= 2
-                self.resources["tools"] += 1
-                self.resources["currency"] += 15
+            if self.resources[MATERIALS] > 2:
+                self.resources[MATERIALS] -= 2
+                self.resources[TOOLS] += 1
+                self.resources[CURRENCY] += 15
         elif self.agent_type == AgentType.TRADER:
-            self.resources["currency"] += random.randint(5, 20)
+            self.resources[CURRENCY] += random.randint(5, 20)
         else:
-            self.resources["currency"] += random.randint(3, 10)
+            self.resources[CURRENCY] += random.randint(3, 10)
 
         self.state = AgentState.WORKING
         self.energy -= 0.05
@@ -301,13 +299,13 @@ class SocietyAgent:
 
     def _gather_food(self):
         """Gather food from environment"""
-        self.resources["food"] += random.randint(5, 15)
+        self.resources[FOOD] += random.randint(5, 15)
         self.energy -= 0.03
 
     def _rest(self):
         """Rest to recover energy"""
         self.energy = min(1.0, self.energy + 0.15)
-        self.resources["food"] -= 1
+        self.resources[FOOD] -= 1
         self.state = AgentState.IDLE
 
     def _update_state(self):
@@ -316,8 +314,8 @@ class SocietyAgent:
         self.age += 0.001
 
         # Consume food
-        if self.resources["food"] > 0:
-            self.resources["food"] -= 0.2
+        if self.resources[FOOD] > 0:
+            self.resources[FOOD] -= 0.2
         else:
             self.energy -= 0.05  # Starving
             self.happiness -= 0.02
@@ -336,12 +334,12 @@ class SocietyAgent:
             self.happiness += 0.01
 
         # Economic pressure
-        if self.resources["currency"] < 50:
+        if self.resources[CURRENCY] < 50:
             self.happiness -= 0.01
 
-    def _add_memory(self, content: str):
-        """Add a memory"""
-        memory = Memory(content, time.time(), random.uniform(0.3, 0.9))
+    def _add_memory(self, content: str, step: int):
+        """Add a memory stamped with the world step it happened in"""
+        memory = Memory(content, step, random.uniform(0.3, 0.9))
         self.memories.append(memory)
 
         # Keep only recent memories (simple version)
@@ -356,13 +354,17 @@ class SocietyAgent:
             "agent_id": self.agent_id,
             "type": self.agent_type.value,
             "cultural_group": self.cultural_group.value,
-            "position": asdict(self.position),
+            "position": {
+                "x": self.position.x,
+                "y": self.position.y,
+                "z": self.position.z,
+            },
             "state": self.state.value,
             "energy": round(self.energy, 2),
             "happiness": round(self.happiness, 2),
             "health": round(self.health, 2),
             "age": round(self.age, 1),
-            "resources": self.resources.copy(),
+            "resources": dict(zip(RESOURCE_NAMES, self.resources, strict=True)),
             "social_connections": len(self.social_connections),
             "memories": len(self.memories),
         }
@@ -377,24 +379,72 @@ class SocietyWorld:
         self.world_size = world_size
         self.agents = []
         self.step_count = 0
+        self._grid: Dict[Tuple[int, int], List[SocietyAgent]] = {}
 
         # Create agents
         for i in range(num_agents):
             agent = SocietyAgent(f"agent_{i}", world_size)
             self.agents.append(agent)
 
-        # World state
-        self.total_resources = {
-            "food": sum(agent.resources["food"] for agent in self.agents),
-            "currency": sum(agent.resources["currency"] for agent in self.agents),
-            "materials": sum(agent.resources["materials"] for agent in self.agents),
-        }
+        self._rebuild_grid()
 
         print(f"Created world with {len(self.agents)} agents")
 
+    @property
+    def total_resources(self) -> Dict[str, float]:
+        """Resource totals across all agents, summed on demand"""
+        rows = map(attrgetter("resources"), self.agents)
+        totals = [sum(column) for column in zip(*rows, strict=True)]
+        return dict(
+            zip(RESOURCE_NAMES, totals or [0] * len(RESOURCE_NAMES), strict=True)
+        )
+
+    def _rebuild_grid(self):
+        """Bucket agents into uniform grid cells for neighbor queries"""
+        grid = defaultdict(list)
+        for agent in self.agents:
+            pos = agent.position
+            grid[(int(pos.x // GRID_CELL_SIZE), int(pos.y // GRID_CELL_SIZE))].append(
+                agent
+            )
+        self._grid = grid
+
+    def neighbors_within(
+        self, agent: SocietyAgent, radius: float
+    ) -> List[Tuple[SocietyAgent, float]]:
+        """Return (other, squared distance) for agents closer than radius.
+
+        Only the 3x3 block of grid cells around the agent is scanned, and
+        agents may have moved one step since the grid was bucketed, so
+        radius plus that step must fit in a cell.
+        """
+        assert radius + MOVEMENT_SPEED <= GRID_CELL_SIZE, "radius exceeds grid cell"
+        pos = agent.position
+        x, y, z = pos.x, pos.y, pos.z
+        cx = int(x // GRID_CELL_SIZE)
+        cy = int(y // GRID_CELL_SIZE)
+        radius_sq = radius * radius
+        grid = self._grid
+
+        result = []
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for other in grid.get((i, j), ()):
+                    if other is agent:
+                        continue
+                    other_pos = other.position
+                    dx = x - other_pos.x
+                    dy = y - other_pos.y
+                    dz = z - other_pos.z
+                    dist_sq = dx * dx + dy * dy + dz * dz
+                    if dist_sq < radius_sq:
+                        result.append((other, dist_sq))
+        return result
+
     def step(self):
         """Run one simulation step"""
         self.step_count += 1
+        self._rebuild_grid()
 
         # Shuffle agents for random order
         agents_shuffled = self.agents.copy()
@@ -409,13 +459,6 @@ class SocietyWorld:
 
     def _update_world_state(self):
         """Update global world state"""
-        self.total_resources = {
-            "food": sum(agent.resources["food"] for agent in self.agents),
-            "currency": sum(agent.resources["currency"] for agent in self.agents),
-            "materials": sum(agent.resources["materials"] for agent in self.agents),
-            "tools": sum(agent.resources["tools"] for agent in self.agents),
-        }
-
         # Population events (simplified)
         if self.step_count % 100 == 0:
             self._population_event()
@@ -429,20 +472,20 @@ class SocietyWorld:
         if event_type == "disaster":
             # Reduce resources
             for agent in self.agents:
-                agent.resources["food"] = max(
-                    0, agent.resources["food"] - random.randint(5, 15)
+                agent.resources[FOOD] = max(
+                    0, agent.resources[FOOD] - random.randint(5, 15)
                 )
                 agent.happiness -= 0.1
         elif event_type == "good_harvest":
             # Increase food
             for agent in self.agents:
                 if agent.agent_type == AgentType.FARMER:
-                    agent.resources["food"] += random.randint(10, 25)
+                    agent.resources[FOOD] += random.randint(10, 25)
         elif event_type == "trade_boom":
             # Increase currency for traders
             for agent in self.agents:
                 if agent.agent_type == AgentType.TRADER:
-                    agent.resources["currency"] += random.randint(50, 150)
+                    agent.resources[CURRENCY] += random.randint(50, 150)
         elif event_type == "cultural_festival":
             # Increase happiness
             for agent in self.agents:
@@ -452,33 +495,27 @@ class SocietyWorld:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get world statistics"""
-        # Agent type distribution
-        type_counts = defaultdict(int)
-        cultural_counts = defaultdict(int)
-        state_counts = defaultdict(int)
+        agents = self.agents
 
-        total_energy = 0
-        total_happiness = 0
-        total_connections = 0
+        # Agent type distribution (counted in C via Counter + attrgetter)
+        type_counts = Counter(map(attrgetter("agent_type"), agents))
+        cultural_counts = Counter(map(attrgetter("cultural_group"), agents))
+        state_counts = Counter(map(attrgetter("state"), agents))
 
-        for agent in self.agents:
-            type_counts[agent.agent_type.value] += 1
-            cultural_counts[agent.cultural_group.value] += 1
-            state_counts[agent.state.value] += 1
-            total_energy += agent.energy
-            total_happiness += agent.happiness
-            total_connections += len(agent.social_connections)
+        total_energy = sum(map(attrgetter("energy"), agents))
+        total_happiness = sum(map(attrgetter("happiness"), agents))
+        total_connections = sum(map(len, map(attrgetter("social_connections"), agents)))
 
         return {
             "step": self.step_count,
-            "agents": len(self.agents),
-            "avg_energy": total_energy / len(self.agents),
-            "avg_happiness": total_happiness / len(self.agents),
+            "agents": len(agents),
+            "avg_energy": total_energy / len(agents),
+            "avg_happiness": total_happiness / len(agents),
             "total_connections": total_connections,
             "total_resources": self.total_resources,
-            "agent_types": dict(type_counts),
-            "cultural_groups": dict(cultural_counts),
-            "agent_states": dict(state_counts),
+            "agent_types": {t.value: n for t, n in type_counts.items()},
+            "cultural_groups": {g.value: n for g, n in cultural_counts.items()},
+            "agent_states": {st.value: n for st, n in state_counts.items()},
         }
 
 
@@ -4,22 +4,72 @@ Ultimate Society Demo - Showcasing the best of our enhanced LLM society simulati
 Features: Advanced agent communication, real-time analytics, economic systems, and more
 """
 
+import io
 import json
+import os
+import sys
 import time
-import random
 import asyncio
 from datetime import datetime
-from dataclasses import asdict
-from typing import List, Dict, Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 import logging
 
-# Import our enhanced systems
-from integrated_enhanced_society import EnhancedSocietySimulator, EnhancedAgent
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The enhanced simulator is imported lazily (see _create_simulator) so the
+# demo module itself stays cheap to import
+if TYPE_CHECKING:
+    from integrated_enhanced_society import EnhancedSocietySimulator, EnhancedAgent
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def _column(agents, attr: str, dtype=np.float64) -> np.ndarray:
+    """Gather one numeric attribute of every agent into an array"""
+    return np.fromiter(map(attrgetter(attr), agents), dtype=dtype, count=len(agents))
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str).encode()
+
+
+def _gini(values: np.ndarray) -> float:
+    """Gini coefficient of a float64 array (sorts a copy)"""
+    arr = np.sort(values)
+    n = arr.size
+    cs = np.cumsum(arr)
+    total = cs[-1]
+    if total == 0:
+        return 0.0
+    return (n + 1 - 2 * cs.sum() / total) / n
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two equal-length float64 arrays"""
+    n = x.size
+    sum_x = x.sum()
+    sum_y = y.sum()
+    sum_xy = x @ y
+    sum_x_sq = x @ x
+    sum_y_sq = y @ y
+
+    numerator = n * sum_xy - sum_x * sum_y
+    denominator = ((n * sum_x_sq - sum_x ** 2) * (n * sum_y_sq - sum_y ** 2)) ** 0.5
+    return numerator / denominator if denominator != 0 else 0.0
+
+
 class UltimateSocietyDemo:
     """Ultimate demonstration of our enhanced LLM society simulation"""
     
@@ -27,6 +77,16 @@ class UltimateSocietyDemo:
         self.num_agents = num_agents
         self.simulator = None
         self.demo_results = []
+        self._trait_names: Optional[Tuple[str, ...]] = None
+        
+        # Interactive command dispatch table
+        self._handlers = {
+            'step': self._cmd_step,
+            'status': self._cmd_status,
+            'agents': self._cmd_agents,
+            'export': self.export_demo_results,
+            'quit': self._cmd_quit,
+        }
         
         # Demo configuration
         self.demo_phases = [
@@ -37,6 +97,12 @@ class UltimateSocietyDemo:
             {"name": "Mature Society", "steps": 35, "description": "Sophisticated cooperation and competition"},
         ]
         
+    @staticmethod
+    def _create_simulator(num_agents: int) -> "EnhancedSocietySimulator":
+        """Import the enhanced simulator on first use and build one"""
+        from integrated_enhanced_society import EnhancedSocietySimulator
+        return EnhancedSocietySimulator(num_agents=num_agents)
+        
     async def run_ultimate_demo(self):
         """Run the ultimate society simulation demo"""
         print("🚀 ULTIMATE LLM SOCIETY SIMULATION DEMO")
@@ -46,7 +112,7 @@ class UltimateSocietyDemo:
         print()
         
         # Initialize simulation
-        self.simulator = EnhancedSocietySimulator(num_agents=self.num_agents)
+        self.simulator = self._create_simulator(self.num_agents)
         
         # Print initial state
         self.print_initial_state()
@@ -75,8 +141,10 @@ class UltimateSocietyDemo:
     def print_initial_state(self):
         """Print initial simulation state"""
         agents = self.simulator.agents
+        buf = io.StringIO()
+        w = buf.write
         
-        print(f"👥 INITIAL AGENT POPULATION: {len(agents)}")
+        w(f"👥 INITIAL AGENT POPULATION: {len(agents)}\n")
         
         # Personality distribution
         personality_counts = {}
@@ -86,249 +154,329 @@ class UltimateSocietyDemo:
                     personality_counts[trait] = []
                 personality_counts[trait].append(value)
         
-        print("\n🧠 PERSONALITY DISTRIBUTION:")
+        w("\n🧠 PERSONALITY DISTRIBUTION:\n")
         for trait, values in personality_counts.items():
             avg_value = sum(values) / len(values)
-            print(f"  {trait.capitalize()}: {avg_value:.3f} (avg)")
+            w(f"  {trait.capitalize()}: {avg_value:.3f} (avg)\n")
             
         # Initial economic state
         total_wealth = sum(agent.wealth for agent in agents)
         avg_wealth = total_wealth / len(agents)
-        print(f"\n💰 INITIAL ECONOMIC STATE:")
-        print(f"  Total Wealth: ${total_wealth:.2f}")
-        print(f"  Average Wealth: ${avg_wealth:.2f}")
+        w(f"\n💰 INITIAL ECONOMIC STATE:\n")
+        w(f"  Total Wealth: ${total_wealth:.2f}\n")
+        w(f"  Average Wealth: ${avg_wealth:.2f}\n")
         
         # Initial health and happiness
         avg_health = sum(agent.health for agent in agents) / len(agents)
         avg_happiness = sum(agent.happiness for agent in agents) / len(agents)
-        print(f"\n❤️  INITIAL WELLBEING:")
-        print(f"  Average Health: {avg_health:.3f}")
-        print(f"  Average Happiness: {avg_happiness:.3f}")
+        w(f"\n❤️  INITIAL WELLBEING:\n")
+        w(f"  Average Health: {avg_health:.3f}\n")
+        w(f"  Average Happiness: {avg_happiness:.3f}\n")
+        
+        # Emit the whole report in one write
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
     def print_final_analysis(self):
         """Print comprehensive final analysis"""
         agents = self.simulator.agents
         metrics = self.simulator.metrics
+        buf = io.StringIO()
+        w = buf.write
         
-        print("\n🔍 COMPREHENSIVE FINAL ANALYSIS")
-        print("=" * 60)
+        w("\n🔍 COMPREHENSIVE FINAL ANALYSIS\n")
+        w("=" * 60 + "\n")
+        
+        # Gather per-agent fields once as column arrays
+        n = len(agents)
+        wealth = _column(agents, 'wealth')
+        health = _column(agents, 'health')
+        happiness = _column(agents, 'happiness')
+        actions_taken = _column(agents, 'actions_taken', np.int64)
+        messages_sent = _column(agents, 'messages_sent', np.int64)
+        social_connections = _column(agents, 'social_connections', np.int64)
         
         # Population analysis
-        active_agents = sum(1 for agent in agents if agent.health > 0.1)
-        print(f"👥 POPULATION ANALYSIS:")
-        print(f"  Total Agents: {len(agents)}")
-        print(f"  Active Agents: {active_agents} ({active_agents/len(agents)*100:.1f}%)")
-        print(f"  Total Actions Taken: {sum(agent.actions_taken for agent in agents)}")
+        active_agents = int(np.count_nonzero(health > 0.1))
+        w(f"👥 POPULATION ANALYSIS:\n")
+        w(f"  Total Agents: {n}\n")
+        w(f"  Active Agents: {active_agents} ({active_agents/n*100:.1f}%)\n")
+        w(f"  Total Actions Taken: {int(actions_taken.sum())}\n")
         
         # Economic analysis
-        wealth_values = [agent.wealth for agent in agents]
-        wealth_values.sort()
-        median_wealth = wealth_values[len(wealth_values)//2] if wealth_values else 0
-        total_wealth = sum(wealth_values)
-        
-        if len(wealth_values) > 10:
-            top_10_percent = wealth_values[int(len(wealth_values)*0.9):]
-            bottom_10_percent = wealth_values[:int(len(wealth_values)*0.1)]
-            wealth_inequality = self.calculate_gini(wealth_values)
+        median_wealth = float(np.median(wealth)) if n else 0
+        total_wealth = float(wealth.sum())
+        
+        if n > 10:
+            # Select the decile boundaries in O(n) instead of sorting
+            k_lo, k_hi = int(n*0.1), int(n*0.9)
+            partitioned = np.partition(wealth, [k_lo, k_hi])
+            top_10_percent = partitioned[k_hi:]
+            bottom_10_percent = partitioned[:k_lo]
+            wealth_inequality = self.calculate_gini(wealth)
         else:
-            top_10_percent = wealth_values[-1:] if wealth_values else [0]
-            bottom_10_percent = wealth_values[:1] if wealth_values else [0]
+            top_10_percent = wealth[[wealth.argmax()]] if n else np.zeros(1)
+            bottom_10_percent = wealth[[wealth.argmin()]] if n else np.zeros(1)
             wealth_inequality = 0.0
         
-        print(f"\n💰 ECONOMIC ANALYSIS:")
-        print(f"  Total Wealth: ${total_wealth:.2f}")
-        print(f"  Average Wealth: ${total_wealth/len(agents):.2f}")
-        print(f"  Median Wealth: ${median_wealth:.2f}")
-        print(f"  Wealth Inequality (Gini): {wealth_inequality:.3f}")
-        print(f"  Top 10% Avg Wealth: ${sum(top_10_percent)/len(top_10_percent):.2f}")
-        print(f"  Bottom 10% Avg Wealth: ${sum(bottom_10_percent)/len(bottom_10_percent):.2f}")
+        w(f"\n💰 ECONOMIC ANALYSIS:\n")
+        w(f"  Total Wealth: ${total_wealth:.2f}\n")
+        w(f"  Average Wealth: ${total_wealth/n:.2f}\n")
+        w(f"  Median Wealth: ${median_wealth:.2f}\n")
+        w(f"  Wealth Inequality (Gini): {wealth_inequality:.3f}\n")
+        w(f"  Top 10% Avg Wealth: ${top_10_percent.mean():.2f}\n")
+        w(f"  Bottom 10% Avg Wealth: ${bottom_10_percent.mean():.2f}\n")
         
         # Social analysis
-        total_messages = sum(agent.messages_sent for agent in agents)
-        total_connections = sum(agent.social_connections for agent in agents)
-        avg_happiness = sum(agent.happiness for agent in agents) / len(agents)
-        avg_health = sum(agent.health for agent in agents) / len(agents)
+        total_messages = int(messages_sent.sum())
+        total_connections = int(social_connections.sum())
+        avg_happiness = happiness.mean()
+        avg_health = health.mean()
         
-        print(f"\n🤝 SOCIAL ANALYSIS:")
-        print(f"  Total Messages Sent: {total_messages}")
-        print(f"  Total Social Connections: {total_connections}")
-        print(f"  Average Happiness: {avg_happiness:.3f}")
-        print(f"  Average Health: {avg_health:.3f}")
+        w(f"\n🤝 SOCIAL ANALYSIS:\n")
+        w(f"  Total Messages Sent: {total_messages}\n")
+        w(f"  Total Social Connections: {total_connections}\n")
+        w(f"  Average Happiness: {avg_happiness:.3f}\n")
+        w(f"  Average Health: {avg_health:.3f}\n")
         
         # Communication analysis
-        print(f"\n💬 COMMUNICATION ANALYSIS:")
-        print(f"  Messages per Agent: {total_messages/len(agents):.1f}")
-        print(f"  Social Connections per Agent: {total_connections/len(agents):.1f}")
+        w(f"\n💬 COMMUNICATION ANALYSIS:\n")
+        w(f"  Messages per Agent: {total_messages/len(agents):.1f}\n")
+        w(f"  Social Connections per Agent: {total_connections/len(agents):.1f}\n")
         
         # Performance metrics from simulator
         if hasattr(self.simulator, 'metrics') and self.simulator.metrics:
-            print(f"\n⚡ PERFORMANCE METRICS:")
+            w(f"\n⚡ PERFORMANCE METRICS:\n")
             for key, value in self.simulator.metrics.items():
                 if isinstance(value, (int, float)):
-                    print(f"  {key.replace('_', ' ').title()}: {value}")
+                    w(f"  {key.replace('_', ' ').title()}: {value}\n")
         
         # Personality analysis
         personality_analysis = self.analyze_personality_outcomes()
-        print(f"\n🧠 PERSONALITY OUTCOMES:")
+        w(f"\n🧠 PERSONALITY OUTCOMES:\n")
         for trait, data in personality_analysis.items():
-            print(f"  {trait.capitalize()}: {data['correlation']:.3f} correlation with success")
+            w(f"  {trait.capitalize()}: {data['correlation']:.3f} correlation with success\n")
+        
+        # Emit the whole report in one write
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
             
-    def calculate_gini(self, values: List[float]) -> float:
+    def calculate_gini(self, values) -> float:
         """Calculate Gini coefficient for inequality measurement"""
-        if not values or len(values) < 2:
+        if values is None or len(values) < 2:
             return 0.0
             
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        cumsum = [0]
-        for val in sorted_values:
-            cumsum.append(cumsum[-1] + val)
-        
-        if cumsum[-1] == 0:
-            return 0.0
-            
-        return (n + 1 - 2 * sum(cumsum) / cumsum[-1]) / n
+        return float(_gini(np.asarray(values, dtype=np.float64)))
             
     def analyze_personality_outcomes(self) -> Dict[str, Dict[str, float]]:
         """Analyze correlation between personality traits and outcomes"""
         agents = self.simulator.agents
-        
-        # Calculate success metric (combination of wealth, happiness, health)
-        for agent in agents:
-            agent.success_score = (
-                agent.wealth * 0.4 + 
-                agent.happiness * 0.3 + 
-                agent.health * 0.3
-            )
-            
-        personality_analysis = {}
-        
-        # Get all personality traits
-        trait_names = set()
-        for agent in agents:
-            trait_names.update(agent.personality.keys())
-        
-        for trait in trait_names:
-            trait_values = []
-            success_values = []
-            
-            for agent in agents:
-                trait_value = agent.personality.get(trait, 0.5)
-                trait_values.append(trait_value)
-                success_values.append(agent.success_score)
-                
-            # Calculate correlation
-            correlation = self.calculate_correlation(trait_values, success_values)
+        n = len(agents)
+        if n == 0:
+            return {}
+        
+        # Calculate success metric (combination of wealth, happiness, health),
+        # accumulating in place to avoid per-term temporaries
+        success = np.multiply(0.4, _column(agents, 'wealth'))
+        success += 0.3 * _column(agents, 'happiness')
+        success += 0.3 * _column(agents, 'health')
+        for agent, score in zip(agents, success.tolist()):
+            agent.success_score = score
             
-            personality_analysis[trait] = {
-                'correlation': correlation,
-                'avg_trait_value': sum(trait_values) / len(trait_values)
+        # Personality schema is fixed at agent creation, so read it once
+        if self._trait_names is None:
+            self._trait_names = tuple(sorted(agents[0].personality.keys()))
+        traits = self._trait_names
+        
+        # (num_agents, num_traits) matrix of trait values
+        trait_matrix = np.fromiter(
+            (agent.personality.get(trait, 0.5) for agent in agents for trait in traits),
+            dtype=np.float64,
+            count=n * len(traits),
+        ).reshape(n, len(traits))
+        
+        # Pearson correlation of every trait column with success in one matmul
+        trait_centered = trait_matrix - trait_matrix.mean(axis=0)
+        success_centered = success - success.mean()
+        denominator = np.linalg.norm(trait_centered, axis=0) * np.linalg.norm(success_centered)
+        numerator = trait_centered.T @ success_centered
+        correlations = np.divide(
+            numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0
+        )
+        trait_means = trait_matrix.mean(axis=0)
+        
+        return {
+            trait: {
+                'correlation': float(correlations[i]),
+                'avg_trait_value': float(trait_means[i]),
             }
-            
-        return personality_analysis
+            for i, trait in enumerate(traits)
+        }
         
-    def calculate_correlation(self, x: List[float], y: List[float]) -> float:
+    def calculate_correlation(self, x, y) -> float:
         """Calculate Pearson correlation coefficient"""
         if len(x) != len(y) or len(x) < 2:
             return 0.0
             
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(x[i] * y[i] for i in range(n))
-        sum_x_sq = sum(x[i] ** 2 for i in range(n))
-        sum_y_sq = sum(y[i] ** 2 for i in range(n))
-        
-        numerator = n * sum_xy - sum_x * sum_y
-        denominator = ((n * sum_x_sq - sum_x ** 2) * (n * sum_y_sq - sum_y ** 2)) ** 0.5
-        
-        return numerator / denominator if denominator != 0 else 0.0
+        return float(_pearson(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)))
+        
+    def _agent_record(self, agent: "EnhancedAgent") -> Dict[str, Any]:
+        """Exported fields for a single agent"""
+        return {
+            'id': agent.agent_id,
+            'position': agent.position,
+            'health': agent.health,
+            'energy': agent.energy,
+            'happiness': agent.happiness,
+            'wealth': agent.wealth,
+            'personality': agent.personality,
+            'social_connections': agent.social_connections,
+            'actions_taken': agent.actions_taken,
+            'messages_sent': agent.messages_sent,
+            'success_score': getattr(agent, 'success_score', 0)
+        }
         
-    def export_demo_results(self):
-        """Export demo results to JSON file"""
-        export_data = {
+    def export_demo_results(self, fmt: str = 'json'):
+        """Export demo results to a JSON (default) or Parquet file"""
+        metadata = {
             'timestamp': datetime.now().isoformat(),
             'num_agents': self.num_agents,
             'final_metrics': getattr(self.simulator, 'metrics', {}),
-            'agent_data': [
-                {
-                    'id': agent.agent_id,
-                    'position': agent.position,
-                    'health': agent.health,
-                    'energy': agent.energy,
-                    'happiness': agent.happiness,
-                    'wealth': agent.wealth,
-                    'personality': agent.personality,
-                    'social_connections': agent.social_connections,
-                    'actions_taken': agent.actions_taken,
-                    'messages_sent': agent.messages_sent,
-                    'success_score': getattr(agent, 'success_score', 0)
-                }
-                for agent in self.simulator.agents
-            ]
         }
+        stem = f"ultimate_demo_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        filename = f"ultimate_demo_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        if fmt == 'parquet':
+            filename, size = self._export_parquet(stem, metadata)
+        else:
+            filename, size = self._export_json(stem, metadata)
             
         print(f"\n💾 RESULTS EXPORTED: {filename}")
-        print(f"   File size: {len(json.dumps(export_data, default=str))} characters")
+        print(f"   File size: {size} bytes")
+        
+    def _export_json(self, stem: str, metadata: Dict[str, Any]) -> Tuple[str, int]:
+        """Write JSON, streaming one agent record at a time; returns (filename, bytes written)"""
+        filename = f"{stem}.json"
+        header = _dumps(metadata)
+        with open(filename, 'wb') as f:
+            # Reopen the header object and append the agent array row by row
+            f.write(header[:-1] + b',"agent_data":[\n')
+            for i, agent in enumerate(self.simulator.agents):
+                if i:
+                    f.write(b',\n')
+                f.write(_dumps(self._agent_record(agent)))
+            f.write(b'\n]}\n')
+            return filename, f.tell()
+            
+    def _export_parquet(self, stem: str, metadata: Dict[str, Any]) -> Tuple[str, int]:
+        """Write one column per agent field to a zstd Parquet file; returns (filename, size)"""
+        # pyarrow is only needed here, so it is not imported at module load
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.warning("pyarrow not available, exporting JSON instead of Parquet")
+            return self._export_json(stem, metadata)
+            
+        filename = f"{stem}.parquet"
+        agents = self.simulator.agents
+        traits = tuple(sorted(agents[0].personality.keys())) if agents else ()
+        personality_type = pa.struct([(trait, pa.float64()) for trait in traits])
+        
+        table = pa.Table.from_pydict({
+            'id': [agent.agent_id for agent in agents],
+            'x': np.fromiter((agent.position['x'] for agent in agents), np.float64, len(agents)),
+            'y': np.fromiter((agent.position['y'] for agent in agents), np.float64, len(agents)),
+            'health': _column(agents, 'health'),
+            'energy': _column(agents, 'energy'),
+            'happiness': _column(agents, 'happiness'),
+            'wealth': _column(agents, 'wealth'),
+            'personality': pa.array([agent.personality for agent in agents], type=personality_type),
+            'social_connections': _column(agents, 'social_connections', np.int64),
+            'actions_taken': _column(agents, 'actions_taken', np.int64),
+            'messages_sent': _column(agents, 'messages_sent', np.int64),
+            'success_score': np.fromiter(
+                (getattr(agent, 'success_score', 0) for agent in agents), np.float64, len(agents)
+            ),
+        })
+        # Run-level fields travel as schema metadata
+        table = table.replace_schema_metadata(
+            {key: _dumps(value) for key, value in metadata.items()}
+        )
+        pq.write_table(table, filename, compression='zstd')
+        return filename, os.path.getsize(filename)
         
     async def run_interactive_demo(self):
         """Run an interactive version of the demo"""
         print("🎮 INTERACTIVE DEMO MODE")
-        print("Commands: 'step', 'status', 'agents', 'export', 'quit'")
+        print(f"Commands: {', '.join(repr(name) for name in self._handlers)}")
         print()
         
-        self.simulator = EnhancedSocietySimulator(num_agents=20)  # Smaller for interactive
+        self.simulator = self._create_simulator(20)  # Smaller for interactive
         
         while True:
             try:
                 command = input("demo> ").strip().lower()
                 
-                if command == 'step':
-                    await self.simulator.run_simulation(steps=1)
-                    print(f"Simulation step completed")
-                          
-                elif command == 'status':
-                    agents = self.simulator.agents
-                    active_agents = sum(1 for agent in agents if agent.health > 0.1)
-                    total_wealth = sum(agent.wealth for agent in agents)
-                    avg_happiness = sum(agent.happiness for agent in agents) / len(agents)
-                    total_messages = sum(agent.messages_sent for agent in agents)
-                    
-                    print(f"Simulation Status:")
-                    print(f"  Active Agents: {active_agents}/{len(agents)}")
-                    print(f"  Total Wealth: ${total_wealth:.2f}")
-                    print(f"  Average Happiness: {avg_happiness:.3f}")
-                    print(f"  Total Messages: {total_messages}")
-                    
-                elif command == 'agents':
-                    for i, agent in enumerate(self.simulator.agents[:5]):  # Show first 5
-                        print(f"  Agent {agent.agent_id}: "
-                              f"pos=({agent.position['x']:.1f},{agent.position['y']:.1f}), "
-                              f"wealth=${agent.wealth:.1f}, "
-                              f"happiness={agent.happiness:.2f}")
-                    if len(self.simulator.agents) > 5:
-                        print(f"  ... and {len(self.simulator.agents) - 5} more agents")
-                        
-                elif command == 'export':
-                    self.export_demo_results()
-                    
-                elif command == 'quit':
-                    print("Demo ended.")
-                    break
+                handler = self._handlers.get(command)
+                if handler is None:
+                    print(f"Unknown command. Available: {', '.join(self._handlers)}")
+                    continue
                     
+                if asyncio.iscoroutinefunction(handler):
+                    done = await handler()
                 else:
-                    print("Unknown command. Available: step, status, agents, export, quit")
+                    done = handler()
+                if done:
+                    break
                     
             except KeyboardInterrupt:
                 print("\nDemo interrupted.")
                 break
             except Exception as e:
                 print(f"Error: {e}")
+                
+    # Interactive command handlers; returning True ends the session
+    
+    async def _cmd_step(self):
+        await self.simulator.run_simulation(steps=1)
+        print(f"Simulation step completed")
+        
+    def _snapshot(self) -> Dict[str, Any]:
+        """Gather the headline status metrics from a single pass over the agents"""
+        agents = self.simulator.agents
+        fields = attrgetter('health', 'wealth', 'happiness', 'messages_sent')
+        health, wealth, happiness, messages = np.array(
+            list(map(fields, agents)), dtype=np.float64
+        ).reshape(-1, 4).T
+        return {
+            'population': len(agents),
+            'active': int(np.count_nonzero(health > 0.1)),
+            'wealth': float(wealth.sum()),
+            'happiness': float(happiness.mean()),
+            'messages': int(messages.sum()),
+        }
+        
+    def _cmd_status(self):
+        snapshot = self._snapshot()
+        
+        print(f"Simulation Status:")
+        print(f"  Active Agents: {snapshot['active']}/{snapshot['population']}")
+        print(f"  Total Wealth: ${snapshot['wealth']:.2f}")
+        print(f"  Average Happiness: {snapshot['happiness']:.3f}")
+        print(f"  Total Messages: {snapshot['messages']}")
+        
+    def _cmd_agents(self):
+        for i, agent in enumerate(self.simulator.agents[:5]):  # Show first 5
+            print(f"  Agent {agent.agent_id}: "
+                  f"pos=({agent.position['x']:.1f},{agent.position['y']:.1f}), "
+                  f"wealth=${agent.wealth:.1f}, "
+                  f"happiness={agent.happiness:.2f}")
+        if len(self.simulator.agents) > 5:
+            print(f"  ... and {len(self.simulator.agents) - 5} more agents")
+            
+    def _cmd_quit(self):
+        print("Demo ended.")
+        return True
 
 async def main():
     """Main demo function"""
@@ -342,4 +490,12 @@ async def main():
         await demo.run_ultimate_demo()
 
 if __name__ == "__main__":
+    # Prefer uvloop's faster event loop when it is installed. The policy
+    # API works on every uvloop release; uvloop.run needs 0.18+
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
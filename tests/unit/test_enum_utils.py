@@ -0,0 +1,29 @@
+"""Unit tests for enum helpers"""
+
+import pytest
+from llm_society.economics.market_system import ResourceType
+from llm_society.social.family_system import FamilyType
+from llm_society.utils.enum_utils import enum_from_value
+
+
+class TestEnumFromValue:
+    """Tests for enum_from_value"""
+
+    def test_value_lookup(self):
+        """Test known values map to their members"""
+        assert enum_from_value(ResourceType, "food") is ResourceType.FOOD
+        assert enum_from_value(FamilyType, "nuclear") is FamilyType.NUCLEAR
+
+    def test_member_passthrough(self):
+        """Test an existing member is returned unchanged, like Enum(member)"""
+        assert enum_from_value(ResourceType, ResourceType.FOOD) is ResourceType.FOOD
+
+    def test_unknown_value_raises_value_error(self):
+        """Test bad values raise the same ValueError as the constructor"""
+        with pytest.raises(ValueError):
+            enum_from_value(ResourceType, "not_a_resource")
+
+    def test_unhashable_value_raises_value_error(self):
+        """Test unhashable input raises ValueError rather than TypeError"""
+        with pytest.raises(ValueError):
+            enum_from_value(ResourceType, ["food"])
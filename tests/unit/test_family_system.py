@@ -26,6 +26,12 @@ class TestFamilyType:
         assert str(FamilyType.NUCLEAR) == "nuclear"
         assert str(FamilyType.CLAN) == "clan"
 
+    def test_family_type_is_str(self):
+        """Test members compare and hash like their string values"""
+        assert isinstance(FamilyType.NUCLEAR, str)
+        assert FamilyType.NUCLEAR == "nuclear"
+        assert {"nuclear": 1}[FamilyType.NUCLEAR] == 1
+
 
 class TestRelationshipType:
     """Tests for RelationshipType enum"""
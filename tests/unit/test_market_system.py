@@ -1,6 +1,7 @@
 """Unit tests for Market System"""
 
 import pytest
+from dataclasses import fields
 from llm_society.economics.market_system import (
     ResourceType,
     TradeOrderType,
@@ -145,3 +146,15 @@ class TestTradeOrder:
         assert restored.price_per_unit == original.price_per_unit
         assert restored.quantity_filled == original.quantity_filled
         assert restored.status == original.status
+
+    def test_to_dict_covers_all_fields(self, sample_trade_order):
+        """Test that to_dict emits every dataclass field"""
+        data = sample_trade_order.to_dict()
+        assert set(data) == {f.name for f in fields(TradeOrder)}
+
+    def test_from_dict_does_not_mutate_input(self, sample_trade_order):
+        """Test that from_dict leaves the source dict untouched"""
+        data = sample_trade_order.to_dict()
+        snapshot = dict(data)
+        TradeOrder.from_dict(data)
+        assert data == snapshot
@@ -2,7 +2,15 @@
 
 import pytest
 import math
-from llm_society.agents.spatial_mixin import Position
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+
+from llm_society.agents.spatial_mixin import (
+    Position,
+    distances_to,
+    move_towards_batch,
+)
 
 
 class TestPosition:
@@ -20,6 +28,17 @@ class TestPosition:
         pos = Position(x=10.0, y=20.0)
         assert pos.z == 0.0
 
+    def test_position_is_immutable(self):
+        """Test that positions are frozen value objects"""
+        pos = Position(x=1.0, y=2.0)
+        with pytest.raises(FrozenInstanceError):
+            pos.x = 5.0
+
+    def test_position_is_hashable(self):
+        """Test that equal positions hash equally"""
+        assert hash(Position(1.0, 2.0, 3.0)) == hash(Position(1.0, 2.0, 3.0))
+        assert len({Position(1.0, 2.0), Position(1.0, 2.0)}) == 1
+
     def test_distance_to_same_position(self):
         """Test distance to same position is zero"""
         pos1 = Position(x=5.0, y=5.0, z=5.0)
@@ -76,3 +95,38 @@ class TestPosition:
         assert pos.x == 5.0
         assert pos.y == 0.0
         assert pos.z == 0.0
+
+
+class TestBatchPositionOps:
+    """Tests for vectorized position helpers"""
+
+    def test_distances_to(self):
+        """Test distances from one position to many"""
+        src = Position(x=0.0, y=0.0)
+        targets = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 0.0], [1.0, 2.0, 2.0]])
+        np.testing.assert_allclose(distances_to(src, targets), [5.0, 0.0, 3.0])
+
+    def test_batch_distance_matches_scalar(self):
+        """Test pairwise batch distances agree with distance_to"""
+        a = [Position(0.0, 0.0), Position(1.0, 1.0, 1.0)]
+        b = [Position(3.0, 4.0), Position(-2.0, 0.5, 7.0), Position(1.0, 1.0, 1.0)]
+        xyz_a = np.array([p.to_array() for p in a])
+        xyz_b = np.array([p.to_array() for p in b])
+        result = Position.batch_distance(xyz_a, xyz_b)
+        assert result.shape == (2, 3)
+        for i, pa in enumerate(a):
+            for j, pb in enumerate(b):
+                assert abs(result[i, j] - pa.distance_to(pb)) < 1e-9
+
+    def test_move_towards_batch_matches_scalar(self):
+        """Test batched movement agrees with move_towards"""
+        starts = [Position(0.0, 0.0), Position(5.0, 5.0), Position(2.0, 2.0)]
+        targets = [Position(10.0, 0.0), Position(5.5, 5.0), Position(2.0, 2.0)]
+        moved = move_towards_batch(
+            np.array([p.to_array() for p in starts]),
+            np.array([p.to_array() for p in targets]),
+            speed=3.0,
+        )
+        for row, start, target in zip(moved, starts, targets):
+            expected = start.move_towards(target, speed=3.0)
+            np.testing.assert_allclose(row, expected.to_array())
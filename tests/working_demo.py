@@ -4,238 +4,362 @@ Working Society Simulator Demo
 Uses actual Mesa framework but removes problematic dependencies
 """
 
-import random
 import time
-from dataclasses import asdict, dataclass
-from enum import Enum
+from bisect import bisect_left
 from typing import Any, Dict, List, Optional
 
 import mesa
 import numpy as np
 from mesa import Agent, Model
-from mesa.datacollection import DataCollector
 from mesa.space import ContinuousSpace
+from scipy.sparse import lil_matrix
+from scipy.spatial import cKDTree
 
+try:
+    from numba import njit
 
-class AgentState(Enum):
-    IDLE = "idle"
-    MOVING = "moving"
-    SOCIALIZING = "socializing"
-    WORKING = "working"
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
+NEIGHBOR_RADIUS = 10.0
 
-@dataclass
-class Position:
-    x: float
-    y: float
-    z: float = 0.0
+# Model-level metrics recorded each step, in column order of SocietyModel.metrics
+METRICS = (
+    "Total_Energy",
+    "Average_Happiness",
+    "Total_Connections",
+    "Average_Age",
+    "Total_Currency",
+)
 
-    def distance_to(self, other: "Position") -> float:
-        return np.sqrt(
-            (self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2
-        )
 
+# Agent state codes, stored in the int8 SocietyModel.state column
+IDLE, MOVING, SOCIALIZING, WORKING = range(4)
 
-class WorkingAgent(Agent):
-    """Mesa-compatible agent without complex dependencies"""
-
-    def __init__(self, unique_id: str, model, position: Position = None):
-        super().__init__(unique_id, model)
-        self.position = position or Position(
-            random.uniform(0, model.space.width),
-            random.uniform(0, model.space.height),
-            0.0,
-        )
-        self.state = AgentState.IDLE
-        self.energy = 1.0
-        self.happiness = random.uniform(0.3, 0.7)
-        self.age = random.uniform(18, 65)
-        self.social_connections = {}
-        self.resources = {
-            "food": random.randint(10, 50),
-            "currency": random.randint(100, 500),
-            "tools": random.randint(1, 5),
-        }
-        self.personality = random.choice(
-            ["extrovert", "introvert", "analytical", "creative"]
-        )
+PERSONALITIES = ("extrovert", "introvert", "analytical", "creative")
+EXTROVERT, INTROVERT, ANALYTICAL, CREATIVE = range(len(PERSONALITIES))
 
-    def step(self):
-        """Agent behavior step"""
-        # Simple decision making without LLM
-        decision = self._make_decision()
-        self._execute_action(decision)
-
-        # Update agent state
-        self._update_state()
-
-    def _make_decision(self) -> str:
-        """Simple rule-based decision making"""
-        nearby_agents = self.model.space.get_neighbors(
-            (self.position.x, self.position.y), radius=10, include_center=False
-        )
+# Actions chosen by the agent kernel
+REST, SOCIALIZE, GATHER_FOOD, MOVE, WORK = range(5)
 
-        # Decision logic based on personality and context
-        if self.energy < 0.3:
-            return "rest"
-        elif (
-            len(nearby_agents) > 0
-            and self.personality == "extrovert"
-            and random.random() < 0.4
-        ):
-            return "socialize"
-        elif self.resources["food"] < 5:
-            return "gather_food"
-        elif random.random() < 0.2:
-            return "move"
-        else:
-            return "work"
-
-    def _execute_action(self, action: str):
-        """Execute the chosen action"""
-        if action == "move":
-            self._move_randomly()
-        elif action == "socialize":
-            self._socialize()
-        elif action == "work":
-            self._work()
-        elif action == "gather_food":
-            self._gather_food()
-        elif action == "rest":
-            self._rest()
-
-    def _move_randomly(self):
-        """Move to a random nearby location"""
-        new_x = max(
-            0, min(self.model.space.width, self.position.x + random.uniform(-5, 5))
-        )
-        new_y = max(
-            0, min(self.model.space.height, self.position.y + random.uniform(-5, 5))
-        )
-        self.position = Position(new_x, new_y, self.position.z)
-        self.model.space.move_agent(self, (new_x, new_y))
-        self.energy -= 0.02
-
-    def _socialize(self):
-        """Interact with nearby agents"""
-        nearby_agents = self.model.space.get_neighbors(
-            (self.position.x, self.position.y), radius=10, include_center=False
-        )
+# (food, currency, tools) produced by one WORK action, per personality
+WORK_DELTAS = np.array(
+    [[2, 3, 0], [2, 3, 0], [0, 5, 1], [2, 3, 0]],
+    dtype=np.float32,
+)
 
-        for other in nearby_agents:
-            if hasattr(other, "social_connections"):
-                # Build social connections
-                if other.unique_id not in self.social_connections:
-                    self.social_connections[other.unique_id] = 0.1
-                    other.social_connections[self.unique_id] = 0.1
-                else:
-                    self.social_connections[other.unique_id] = min(
-                        1.0, self.social_connections[other.unique_id] + 0.05
-                    )
-
-                # Trade occasionally
-                if random.random() < 0.1:
-                    self._trade_with(other)
-
-        self.happiness += 0.05
-        self.energy -= 0.01
-
-    def _work(self):
-        """Work to produce resources"""
-        if self.personality == "analytical":
-            # Produce tools
-            self.resources["tools"] += 1
-            self.resources["currency"] += 5
-        else:
-            # Produce food or currency
-            self.resources["food"] += 2
-            self.resources["currency"] += 3
-
-        self.energy -= 0.05
-
-    def _gather_food(self):
-        """Gather food from environment"""
-        self.resources["food"] += random.randint(3, 8)
-        self.energy -= 0.03
-
-    def _rest(self):
-        """Rest to recover energy"""
-        self.energy = min(1.0, self.energy + 0.1)
-        self.resources["food"] -= 0.5
-
-    def _trade_with(self, other):
-        """Simple trading mechanism"""
-        if self.resources["currency"] > 10 and other.resources["food"] > 5:
-            # Buy food
-            trade_amount = min(5, other.resources["food"])
-            cost = trade_amount * 2
-
-            if self.resources["currency"] >= cost:
-                self.resources["food"] += trade_amount
-                self.resources["currency"] -= cost
-                other.resources["food"] -= trade_amount
-                other.resources["currency"] += cost
-
-    def _update_state(self):
-        """Update agent state"""
-        # Age slowly
-        self.age += 0.001
 
-        # Consume food
-        if self.resources["food"] > 0:
-            self.resources["food"] -= 0.1
-        else:
-            self.energy -= 0.02  # Starving
+def _column_view(name: str, doc: str) -> property:
+    """Expose the agent's row of one model column as an attribute"""
 
-        # Happiness decay
-        self.happiness = max(0.1, self.happiness - 0.01)
+    def fget(self):
+        return getattr(self.model, name)[self.idx]
+
+    def fset(self, value):
+        getattr(self.model, name)[self.idx] = value
+
+    return property(fget, fset, doc=doc)
+
+
+class WorkingAgent(Agent):
+    """Mesa-compatible agent without complex dependencies
+
+    Numeric state lives in parallel arrays on the model; the agent is a thin
+    view onto row ``idx`` of those arrays, which is also its integer id.
+    """
+
+    energy = _column_view("energy", "Energy level in [0, 1]")
+    happiness = _column_view("happiness", "Happiness level")
+    age = _column_view("age", "Age in years")
+    food = _column_view("food", "Units of food held")
+    currency = _column_view("currency", "Units of currency held")
+    tools = _column_view("tools", "Number of tools held")
+    state = _column_view("state", "State code: IDLE, MOVING, SOCIALIZING or WORKING")
+
+    def __init__(self, unique_id: int, model):
+        super().__init__(model)
+        self.unique_id = unique_id
+        self.idx = unique_id
+
+    @property
+    def personality(self) -> str:
+        return PERSONALITIES[self.model.personality[self.idx]]
+
+    def _socialize(self, nearby_agents: np.ndarray):
+        """Record this step's interactions with nearby agents"""
+        conn = self.model.conn
+        i = self.idx
+
+        # Edit the LIL row lists in place; conn[i, j] re-validates its
+        # arguments on every call, which dominates this loop
+        cols, strengths = conn.rows[i], conn.data[i]
+        for j in nearby_agents.tolist():
+            k = bisect_left(cols, j)
+            if k < len(cols) and cols[k] == j:
+                strengths[k] = min(1.0, strengths[k] + 0.05)
+            else:
+                # Build social connections; ties are always created in pairs
+                cols.insert(k, j)
+                strengths.insert(k, 0.1)
+                other_cols = conn.rows[j]
+                k = bisect_left(other_cols, i)
+                other_cols.insert(k, i)
+                conn.data[j].insert(k, 0.1)
+
+
+def _step_agents(
+    energy,
+    happiness,
+    food,
+    currency,
+    personality,
+    neighbors_flat,
+    neighbors_offsets,
+    r_socialize,
+    r_move,
+    r_trade,
+    gathered,
+):
+    """Decide and act for every agent in turn, returning the chosen actions
+
+    Moving and working are left to the caller, which applies each to all of
+    its agents in one batch.
+
+    Neighbours are given in CSR form: agent i's neighbours are
+    neighbors_flat[neighbors_offsets[i]:neighbors_offsets[i + 1]]. The random
+    draws are made by the caller: one uniform per agent for each decision
+    gate, one per neighbour entry for trades, and each agent's food yield.
+    """
+    n = energy.shape[0]
+    actions = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        start = neighbors_offsets[i]
+        stop = neighbors_offsets[i + 1]
+
+        # Decision logic based on personality and context
+        if energy[i] < 0.3:
+            action = REST
+        elif stop > start and personality[i] == EXTROVERT and r_socialize[i] < 0.4:
+            action = SOCIALIZE
+        elif food[i] < 5:
+            action = GATHER_FOOD
+        elif r_move[i] < 0.2:
+            action = MOVE
+        else:
+            action = WORK
+        actions[i] = action
+
+        if action == SOCIALIZE:
+            # Trade occasionally: buy food from a neighbour
+            for k in range(start, stop):
+                j = neighbors_flat[k]
+                if r_trade[k] < 0.1 and currency[i] > 10 and food[j] > 5:
+                    trade_amount = min(5.0, food[j])
+                    cost = trade_amount * 2
+                    if currency[i] >= cost:
+                        food[i] += trade_amount
+                        currency[i] -= cost
+                        food[j] -= trade_amount
+                        currency[j] += cost
+            happiness[i] += 0.05
+            energy[i] -= 0.01
+        elif action == GATHER_FOOD:
+            food[i] += gathered[i]
+            energy[i] -= 0.03
+        elif action == REST:
+            # Rest to recover energy
+            energy[i] = min(1.0, energy[i] + 0.1)
+            food[i] -= 0.5
+    return actions
+
+
+def _reduce_state(energy, happiness, age, currency):
+    """Totals of the per-agent columns reported each step"""
+    return (
+        energy.sum(dtype=np.float64),
+        happiness.sum(dtype=np.float64),
+        age.sum(dtype=np.float64),
+        currency.sum(dtype=np.float64),
+    )
+
+
+if NUMBA_AVAILABLE:
+    # Sequential rather than prange: trades write to neighbours' rows
+    _step_agents = njit(cache=True)(_step_agents)
+
+    @njit(cache=True)
+    def _reduce_state(energy, happiness, age, currency):
+        # Accumulate all four totals in a single pass over the agents
+        total_energy = total_happiness = total_age = total_currency = 0.0
+        for i in range(energy.shape[0]):
+            total_energy += energy[i]
+            total_happiness += happiness[i]
+            total_age += age[i]
+            total_currency += currency[i]
+        return total_energy, total_happiness, total_age, total_currency
 
 
 class SocietyModel(Model):
     """Mesa model for society simulation"""
 
-    def __init__(self, num_agents: int = 50, width: int = 100, height: int = 100):
+    def __init__(
+        self,
+        num_agents: int = 50,
+        width: int = 100,
+        height: int = 100,
+        max_steps: int = 1000,
+    ):
         super().__init__()
 
         self.num_agents = num_agents
         self.space = ContinuousSpace(width, height, torus=True)
-        # Create a simple scheduler since mesa.time doesn't exist in newer versions
-        self.agent_list = []
-
-        # Create agents
-        for i in range(num_agents):
-            agent = WorkingAgent(f"agent_{i}", self)
-            self.agent_list.append(agent)
-            self.space.place_agent(agent, (agent.position.x, agent.position.y))
-
-        # Data collection
-        self.datacollector = DataCollector(
-            model_reporters={
-                "Total_Energy": lambda m: sum(agent.energy for agent in m.agent_list),
-                "Average_Happiness": lambda m: sum(
-                    agent.happiness for agent in m.agent_list
-                )
-                / len(m.agent_list),
-                "Total_Connections": lambda m: sum(
-                    len(agent.social_connections) for agent in m.agent_list
-                ),
-                "Average_Age": lambda m: sum(agent.age for agent in m.agent_list)
-                / len(m.agent_list),
-                "Total_Currency": lambda m: sum(
-                    agent.resources["currency"] for agent in m.agent_list
-                ),
-            }
+        self.bounds = np.array([width, height], dtype=np.float32)
+
+        # Per-agent state as parallel arrays; each agent is a view onto one row.
+        # Initial values are drawn in one batch per field.
+        rng = self.rng
+        self.pos_xy = rng.uniform((0, 0), (width, height), size=(num_agents, 2)).astype(
+            np.float32
         )
+        self.energy = np.ones(num_agents, dtype=np.float32)
+        self.happiness = rng.uniform(0.3, 0.7, num_agents).astype(np.float32)
+        self.age = rng.uniform(18, 65, num_agents).astype(np.float32)
+        self.food = rng.integers(10, 51, num_agents).astype(np.float32)
+        self.currency = rng.integers(100, 501, num_agents).astype(np.float32)
+        self.tools = rng.integers(1, 6, num_agents).astype(np.float32)
+        self.personality = rng.integers(
+            len(PERSONALITIES), size=num_agents, dtype=np.int8
+        )
+        self.state = np.full(num_agents, IDLE, dtype=np.int8)
+
+        # Connection strength from row agent to column agent
+        self.conn = lil_matrix((num_agents, num_agents), dtype=np.float32)
+
+        # Create agents, then place them from the position array. The list is a
+        # simple scheduler since mesa.time doesn't exist in newer versions
+        self.agent_list = [WorkingAgent(i, self) for i in range(num_agents)]
+        for agent, pos in zip(self.agent_list, self.pos_xy.tolist(), strict=True):
+            self.space.place_agent(agent, tuple(pos))
+
+        # Data collection: one preallocated row per step plus the initial state
+        self.metrics = np.empty((max_steps + 1, len(METRICS)))
+        self.step_idx = 0
 
         self.running = True
-        self.datacollector.collect(self)
+        self._collect()
 
     def step(self):
         """Run one model step"""
-        # Step all agents
-        for agent in self.agent_list:
-            agent.step()
-        self.datacollector.collect(self)
+        self._build_neighbors()
+
+        # Draw all of this step's random numbers up front
+        n = self.num_agents
+        r_socialize = self.rng.random(n, dtype=np.float32)
+        r_move = self.rng.random(n, dtype=np.float32)
+        r_trade = self.rng.random(len(self._neighbors_flat), dtype=np.float32)
+        gathered = self.rng.integers(3, 9, n).astype(np.float32)
+
+        # Decide and act for all agents in one compiled pass
+        actions = _step_agents(
+            self.energy,
+            self.happiness,
+            self.food,
+            self.currency,
+            self.personality,
+            self._neighbors_flat,
+            self._neighbors_offsets,
+            r_socialize,
+            r_move,
+            r_trade,
+            gathered,
+        )
+        self._move_agents(np.flatnonzero(actions == MOVE))
+        self._work_agents(np.flatnonzero(actions == WORK))
+        self._record_socializing(np.flatnonzero(actions == SOCIALIZE))
+        self._update_state_all()
+        self._collect()
+
+    def _collect(self):
+        """Record the model-level metrics for the current step"""
+        if self.step_idx == len(self.metrics):
+            # Ran past max_steps; double the buffer
+            self.metrics = np.concatenate((self.metrics, np.empty_like(self.metrics)))
+        energy, happiness, age, currency = _reduce_state(
+            self.energy, self.happiness, self.age, self.currency
+        )
+        self.metrics[self.step_idx] = (
+            energy,
+            happiness / self.num_agents,
+            self.conn.nnz,
+            age / self.num_agents,
+            currency,
+        )
+        self.step_idx += 1
+
+    def latest_metrics(self) -> Dict[str, float]:
+        """The most recently collected metrics, keyed by name"""
+        return dict(zip(METRICS, self.metrics[self.step_idx - 1].tolist(), strict=True))
+
+    def _build_neighbors(self):
+        """Find every agent's neighbours for this step with one KD-tree query"""
+        # The space is a torus, so wrap the tree the same way
+        tree = cKDTree(np.mod(self.pos_xy, self.bounds), boxsize=self.bounds)
+        pairs = tree.query_pairs(NEIGHBOR_RADIUS, output_type="ndarray")
+
+        # Store both directions of each pair in CSR form, grouped by agent
+        rows = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        cols = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        self._neighbors_flat = cols[np.argsort(rows, kind="stable")].astype(np.int32)
+        self._neighbors_offsets = np.zeros(self.num_agents + 1, dtype=np.int32)
+        np.cumsum(
+            np.bincount(rows, minlength=self.num_agents),
+            out=self._neighbors_offsets[1:],
+        )
+
+    def _neighbors(self, i: int) -> np.ndarray:
+        """Indices of agent i's neighbours this step"""
+        return self._neighbors_flat[
+            self._neighbors_offsets[i] : self._neighbors_offsets[i + 1]
+        ]
+
+    def _move_agents(self, movers: np.ndarray):
+        """Move every mover to a random nearby location in one batch"""
+        moved = self.pos_xy[movers]
+        moved += self.rng.uniform(-5, 5, size=(len(movers), 2))
+        np.clip(moved, 0, self.bounds, out=moved)
+        self.pos_xy[movers] = moved
+        self.energy[movers] -= 0.02
+
+        agents = self.agent_list
+        for i, pos in zip(movers.tolist(), moved.tolist(), strict=True):
+            self.space.move_agent(agents[i], tuple(pos))
+
+    def _work_agents(self, workers: np.ndarray):
+        """Produce resources for every worker at once, by personality"""
+        deltas = WORK_DELTAS[self.personality[workers]]
+        self.food[workers] += deltas[:, 0]
+        self.currency[workers] += deltas[:, 1]
+        self.tools[workers] += deltas[:, 2]
+        self.energy[workers] -= 0.05
+
+    def _record_socializing(self, socializers: np.ndarray):
+        """Update the social connections of every agent that socialized"""
+        for i in socializers:
+            self.agent_list[i]._socialize(self._neighbors(i))
+
+    def _update_state_all(self):
+        """Apply the per-step upkeep to every agent at once"""
+        # Age slowly
+        self.age += 0.001
+
+        # Consume food, or lose energy when starving
+        starving = self.food <= 0
+        np.subtract(self.food, 0.1, out=self.food, where=~starving)
+        self.energy[starving] -= 0.02
+
+        # Happiness decay
+        np.maximum(self.happiness - 0.01, 0.1, out=self.happiness)
 
 
 def run_simulation(num_agents: int = 50, steps: int = 200):
@@ -245,7 +369,7 @@ def run_simulation(num_agents: int = 50, steps: int = 200):
     print(f"   Steps: {steps}")
     print("=" * 50)
 
-    model = SocietyModel(num_agents=num_agents)
+    model = SocietyModel(num_agents=num_agents, max_steps=steps)
 
     start_time = time.time()
 
@@ -253,7 +377,7 @@ def run_simulation(num_agents: int = 50, steps: int = 200):
         model.step()
 
         if step % 40 == 0:
-            data = model.datacollector.get_model_vars_dataframe().iloc[-1]
+            data = model.latest_metrics()
             print(
                 f"Step {step:3d}: "
                 f"Energy: {data['Total_Energy']:.1f}, "
@@ -268,7 +392,7 @@ def run_simulation(num_agents: int = 50, steps: int = 200):
     print(f"\nCompleted in {elapsed:.2f}s ({sps:.1f} SPS)")
 
     # Final analysis
-    final_data = model.datacollector.get_model_vars_dataframe().iloc[-1]
+    final_data = model.latest_metrics()
     print("\n📊 Final Results:")
     print(f"   Average Energy: {final_data['Total_Energy']/num_agents:.2f}")
     print(f"   Average Happiness: {final_data['Average_Happiness']:.2f}")
@@ -277,13 +401,12 @@ def run_simulation(num_agents: int = 50, steps: int = 200):
     print(f"   Total Wealth: {int(final_data['Total_Currency'])}")
 
     # Agent analysis
-    personalities = {}
-    for agent in model.agent_list:
-        personalities[agent.personality] = personalities.get(agent.personality, 0) + 1
+    personalities = np.bincount(model.personality, minlength=len(PERSONALITIES))
 
     print("\n👥 Agent Personalities:")
-    for personality, count in personalities.items():
-        print(f"   {personality}: {count}")
+    for personality, count in zip(PERSONALITIES, personalities, strict=True):
+        if count:
+            print(f"   {personality}: {count}")
 
     return model
 
@@ -300,9 +423,7 @@ def main():
         model = run_simulation(num_agents, 150)
 
         # Calculate social density
-        total_connections = sum(
-            len(agent.social_connections) for agent in model.agent_list
-        )
+        total_connections = model.conn.nnz
         social_density = total_connections / num_agents
         print(f"   Social Density: {social_density:.1f} connections per agent")
 